@@ -1,8 +1,8 @@
-from jinja2 import Template
+from jinja2 import Environment
 
 
 numbers = [1,2,3,4,5,6,7,8]
-template = """Hello {{name | title}},
+TEMPLATE = """Hello {{name | title}},
 Hope you are doing well!
 Please confirm the following order:
 {{quantity | unique | max}} {{type | replace ("books","NOTEBOOKS") | lower}}, {% for key, value in collection.items() %} 
@@ -23,7 +23,14 @@ data = {
     "collection" : {"Pencils":"2","Pens":"3", "Stencils":"5", "Erasers":"5" }
 }
 
-j2_template = Template(template)
+_ENV = Environment()
+_TEMPLATE = _ENV.from_string(TEMPLATE)
 
-print(j2_template.render(data))
+
+def render(data):
+    return _TEMPLATE.render(data)
+
+
+if __name__ == "__main__":
+    print(render(data))
 
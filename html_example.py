@@ -1,16 +1,15 @@
-from jinja2 import Environment, FileSystemLoader
+from jinja_env import get_env
 
-environment = Environment(loader=FileSystemLoader("templates/"))
-template = environment.get_template("sample_index.html")
+template = get_env().get_template("sample_index.html")
 
-message = template.render(
-    {
-        "title": "HASHNODE JINJA DEMO",
-        "about": "Using Template Examples",
-        "description": "In step wise approach of templating, with scenarios from day to day life",
-    }
-)
+data = {
+    "title": "HASHNODE JINJA DEMO",
+    "about": "Using Template Examples",
+    "description": "In step wise approach of templating, with scenarios from day to day life",
+}
 
-# w+ is to create a file if not present
-with open("index.html",'w+') as f:
-    f.write(message)
\ No newline at end of file
+if __name__ == "__main__":
+    stream = template.stream(data)
+    # render in small chunks straight to the file instead of building one string
+    stream.enable_buffering(size=5)
+    stream.dump("index.html", encoding="utf-8")
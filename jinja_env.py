@@ -0,0 +1,26 @@
+import functools
+import os
+
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    select_autoescape,
+)
+
+CACHE_DIR = ".jinja_cache"
+
+
+# one Environment per templates directory, shared by all the examples
+@functools.lru_cache(maxsize=1)
+def get_env(templates_dir="templates"):
+    # compiled templates are kept on disk so later runs skip the compile step
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    return Environment(
+        loader=FileSystemLoader(templates_dir),
+        autoescape=select_autoescape(["html"]),
+        # set JINJA_DEV=1 while editing templates to pick up changes
+        auto_reload=os.environ.get("JINJA_DEV", "0") != "0",
+        bytecode_cache=FileSystemBytecodeCache(CACHE_DIR, pattern="%s.cache"),
+        cache_size=400,
+    )
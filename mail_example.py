@@ -1,17 +1,15 @@
-from jinja2 import Environment, FileSystemLoader
+from jinja_env import get_env
 
-environment = Environment(loader=FileSystemLoader("templates/"))
-template = environment.get_template("email.txt")
+template = get_env().get_template("email.txt")
 
-message = template.render(
-    {
-        "user": "Milo",
-        "program": "Little Lamps Program",
-        "date": "26-08-2022",
-        "time": "10:00 AM",
-        "manager": "Pakhi",
-        "team": "Creative Division",
-    }
-)
+data = {
+    "user": "Milo",
+    "program": "Little Lamps Program",
+    "date": "26-08-2022",
+    "time": "10:00 AM",
+    "manager": "Pakhi",
+    "team": "Creative Division",
+}
 
-print(message)
+if __name__ == "__main__":
+    print(template.render(data))
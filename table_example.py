@@ -1,7 +1,6 @@
-from jinja2 import Environment, FileSystemLoader
+from jinja_env import get_env
 
-environment = Environment(loader=FileSystemLoader("templates/"))
-template = environment.get_template("table")
+template = get_env().get_template("table")
 
 json_data = {
     "data": [{"Id": 1, "Number": 45, "Name": "Milk"},
@@ -14,7 +13,8 @@ json_data = {
     ]
 }
 
-message = template.render(json_data)
-# w+ is to create a file if not present
-with open("index.html", "w+") as f:
-    f.write(message)
+if __name__ == "__main__":
+    stream = template.stream(json_data)
+    # render in small chunks straight to the file instead of building one string
+    stream.enable_buffering(size=5)
+    stream.dump("index.html", encoding="utf-8")